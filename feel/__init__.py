@@ -1,4 +1,4 @@
-# pylint: disable=E1133,E0213,E1136,E0213,E0211,E1102,C0301
+# pylint: disable=E1133,E0213,E1136,E0213,E0211,E1102,C0301,C0302
 """
 feel: a module to filter rows by column values in a CSV file
 
@@ -27,15 +27,34 @@ Filters
     "col_name:~val_1|val_2"                    col_name IS NOT IN [val1, val2]      [number, string]
 """
 import argparse
-import functools
+import math
+import os
+import re
+import shutil
 import sys
-from typing import Any, List, Optional, Tuple
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from feel import _version
 
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover
+    pa = pc = pacsv = None
+
 __version__ = _version.get_versions()["version"]
 
 
@@ -50,6 +69,63 @@ FILTER TYPES\t\t\t\tDESCRIPTION\t\t\t\tSUPPORTED TYPES
 "col_name:~filter_vals|filter_vals"\tcol_name IS NOT IN [val1, val2]\t\t[number, string]\n
 """
 FILTER_OPERATORS = ["~", ">", "<", "|"]
+# operators written in front of the filter value, "|" separates values instead
+PREFIX_OPERATORS = frozenset(FILTER_OPERATORS) - {"|"}
+# number of rows read from the input CSV at a time
+CHUNKSIZE = 1_000_000
+# chunks filtered in background threads while the next one is read (pyarrow / numpy
+# kernels release the GIL), at most FILTER_WORKERS + 1 chunks of --chunksize rows are held
+# in memory at once so it stays small whatever the number of cores
+FILTER_WORKERS = min(4, os.cpu_count() or 1)
+# numeric comparisons are routed through numexpr once a column is at least this long
+# (below that its thread pool costs more than it saves, same cut-off pandas uses)
+NUMEXPR_MIN_ELEMENTS = 1_000_000
+NUMEXPR_DTYPES = {np.dtype(dtype) for dtype in ("int32", "int64", "float32", "float64")}
+# strings pandas reads as NaN by default, pyarrow is told to do the same
+NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+# scalar filter values are classified once by pattern instead of by trial conversion
+INT_PATTERN = re.compile(r"[+-]?\d+")
+FLOAT_PATTERN = re.compile(
+    r"[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?|inf(?:inity)?|nan)", re.IGNORECASE
+)
+# compiled filters kept around for repeated runs with the same filters in one process
+COMPILED_CACHE_SIZE = 256
+INT64_MIN, INT64_MAX = int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)
+# IS IN lists up to this long are costed as short lookups when ordering filters
+SHORT_LIST = 8
+# rows used to estimate how many rows each filter removes when ordering filters
+SAMPLE_ROWS = 10_000
+# pyarrow filters switch from whole columns to the surviving rows below this share of rows
+# (gathering rows costs several times more per row than a comparison kernel)
+ARROW_NARROW_FRACTION = 0.1
+ARROW_KERNELS = {None: "equal", "~": "equal", ">": "greater", "<": "less"}
+QUERY_OPERATORS = {None: "==", "~": "!=", ">": ">", "<": "<"}
+NUMEXPR_EXPRESSIONS = {
+    None: "values == filter_val",
+    "~": "values != filter_val",
+    ">": "values > filter_val",
+    "<": "values < filter_val",
+}
 
 
 class Operations:
@@ -97,9 +173,11 @@ class Operations:
             return False
 
     @staticmethod
-    def conjunction(*conditions: List[Any]):
+    def conjunction(*conditions: List[Any]) -> np.ndarray:
         """
-        Chain pandas filters stored in a list together. See link below for more info :-
+        Chain pandas filters stored in a list together. The first condition is copied
+        into a single boolean buffer & every other condition is AND-ed into it in place,
+        so only one mask is ever allocated. Stops as soon as no element is True. See link below for more info :-
         https://stackoverflow.com/questions/13611065/efficient-way-to-apply-multiple-filters-to-pandas-dataframe-or-series
 
         Args
@@ -110,7 +188,13 @@ class Operations:
         -------
             np.ndarray: Result of applying logical AND to the conditions.
         """
-        return functools.reduce(np.logical_and, conditions)
+        accumulated = np.array(conditions[0], dtype=bool)
+        for condition in conditions[1:]:
+            # nothing left to rule out, the remaining conditions can't change the result
+            if not accumulated.any():
+                break
+            np.logical_and(accumulated, np.asarray(condition), out=accumulated)
+        return accumulated
 
 
 class Terminal:
@@ -145,6 +229,9 @@ class Terminal:
         except TypeError:
             return formatter
 
+    # probing whether the formatter accepts a wider layout is done once, not per parser
+    _wide_formatter = staticmethod(_prettier(argparse.RawTextHelpFormatter))
+
     @staticmethod
     def parser() -> argparse.ArgumentParser:
         """
@@ -154,9 +241,7 @@ class Terminal:
         -------
             argparse.ArgumentParser: The configured argument parser.
         """
-        parser = argparse.ArgumentParser(
-            formatter_class=Terminal._prettier(argparse.RawTextHelpFormatter)
-        )
+        parser = argparse.ArgumentParser(formatter_class=Terminal._wide_formatter)
         parser.add_argument("input", help="path to input CSV file")
         parser.add_argument("output", help="path to output CSV file")
         parser.add_argument(
@@ -188,25 +273,359 @@ class Terminal:
             default=None,
             nargs="?",
         )
+        parser.add_argument(
+            "--columns",
+            help="column to write to the output CSV, repeat for several (default: all)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--chunksize",
+            help="number of rows read from the input CSV at a time",
+            type=Terminal._positive_int,
+            default=CHUNKSIZE,
+        )
+        parser.add_argument(
+            "--arrow-writer",
+            help="write the output CSV with pyarrow (faster, formats values differently)",
+            action="store_true",
+            default=False,
+        )
         parser.add_argument(
             "-f", "--filter", action="append", help=f"{FILTER_TYPES}", required=True
         )
         return parser
 
     @staticmethod
-    def reader(path: str) -> pd.DataFrame:
+    def _positive_int(value: Any) -> int:
+        """
+        Check a number of rows to read at a time (also parses the --chunksize command line
+        argument), chunks of no rows would never end.
+
+        Args
+        ----
+            - value (Any): The number of rows, as an int or a command line string.
+
+        Returns
+        -------
+            int: The number of rows read at a time.
+
+        Raises
+        ------
+            argparse.ArgumentTypeError: If value is not a positive integer.
+        """
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            number = 0
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+        return number
+
+    @staticmethod
+    def _temp_path(path: str) -> str:
+        """
+        Create an empty temporary file next to a file, so it can later replace that file
+        with os.replace (same directory, same file system).
+
+        Args
+        ----
+            - path (str): The path to the file that will be replaced.
+
+        Returns
+        -------
+            str: The path to the temporary file.
+        """
+        handle, temp = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), prefix=".feel-", suffix=".csv"
+        )
+        os.close(handle)
+        return temp
+
+    @staticmethod
+    def reader(
+        path: str,
+        chunksize: Optional[int] = None,
+        usecols: Optional[List[str]] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Read a CSV file into a pandas DataFrame.
 
         Args
         ----
             - path (str): The path to the CSV file.
+            - chunksize (int): Read the file this many rows at a time. Default is None (all at once).
+            - usecols (List[str]): Only parse these columns. Default is None (all columns).
+
+        Returns
+        -------
+            Union[pd.DataFrame, Iterator[pd.DataFrame]]: The DataFrame created from the CSV file, or
+                                                         an iterator over its chunks.
+
+        Raises
+        ------
+            argparse.ArgumentTypeError: If chunksize is not a positive integer.
+        """
+        if chunksize is not None:
+            chunksize = Terminal._positive_int(chunksize)
+        if pacsv is None:
+            return pd.read_csv(path, chunksize=chunksize, usecols=usecols)
+        if chunksize is not None:
+            return Terminal._arrow_chunks(path, chunksize, usecols)
+        try:
+            return pacsv.read_csv(
+                path, convert_options=Terminal._arrow_options(path, usecols)
+            ).to_pandas()
+        except pa.ArrowInvalid:
+            return pd.read_csv(path, usecols=usecols)
+
+    @staticmethod
+    def writer(
+        dataframe: pd.DataFrame, path: str, append: bool = False, arrow: bool = False
+    ):
+        """
+        Write a pandas DataFrame to a CSV file, without its index. On request pyarrow formats
+        the rows from its columnar buffers, which is much faster than pandas' row by row
+        writer but formats values its own way (quoted strings, 239.0 as 239, true / false).
+
+        Args
+        ----
+            - dataframe (pd.DataFrame): The DataFrame to write.
+            - path (str): The path to the CSV file.
+            - append (bool): Append rows to an existing CSV file, without writing the header.
+                             Default is False.
+            - arrow (bool): Write with pyarrow if it is installed & can convert the DataFrame.
+                            Default is False (pandas' to_csv formatting).
+        """
+        if arrow and pacsv is not None:
+            try:
+                table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            except pa.ArrowException:
+                pass
+            else:
+                write_options = pacsv.WriteOptions(
+                    include_header=not append, quoting_style="needed"
+                )
+                with open(path, "ab" if append else "wb") as sink:
+                    pacsv.write_csv(table, sink, write_options=write_options)
+                return
+        dataframe.to_csv(
+            path, mode="a" if append else "w", header=not append, index=False
+        )
+
+    @staticmethod
+    def _arrow_options(
+        path: str, usecols: Optional[List[str]] = None
+    ) -> "pacsv.ConvertOptions":
+        """
+        Build pyarrow CSV conversion options that match what pandas would infer. pyarrow
+        parses ISO dates into timestamps & empty columns into a null type, so the schema
+        of the first block is sniffed & those columns are read as strings / floats instead.
+
+        Args
+        ----
+            - path (str): The path to the CSV file.
+            - usecols (List[str]): Only parse these columns. Default is None (all columns).
+
+        Returns
+        -------
+            pacsv.ConvertOptions: The conversion options.
+
+        Raises
+        ------
+            pa.ArrowInvalid: If pyarrow can't read the file the way pandas does, i.e. it has
+                             duplicate column names (pandas renames them A, A.1) or integers
+                             beyond int64 (pyarrow reads them as lossy floats).
+        """
+        convert_options = pacsv.ConvertOptions(
+            null_values=NULL_VALUES, strings_can_be_null=True
+        )
+        with pacsv.open_csv(path, convert_options=convert_options) as stream:
+            schema = stream.schema
+        if len(set(schema.names)) != len(schema.names):
+            raise pa.ArrowInvalid("duplicate column names")
+        Terminal._check_float_columns(path, schema)
+        convert_options.include_columns = usecols or []
+        convert_options.column_types = {
+            field.name: pa.string()
+            if pa.types.is_temporal(field.type)
+            else pa.float64()
+            for field in schema
+            if pa.types.is_temporal(field.type) or pa.types.is_null(field.type)
+        }
+        return convert_options
+
+    @staticmethod
+    def _check_float_columns(path: str, schema: "pa.Schema"):
+        """
+        Check the float columns pyarrow sniffed from the first block of a CSV file hold
+        floats. pyarrow reads integers beyond int64 as float64 where pandas keeps them exact
+        (uint64 or strings).
+
+        Args
+        ----
+            - path (str): The path to the CSV file.
+            - schema (pa.Schema): The schema pyarrow sniffed from the first block.
+
+        Raises
+        ------
+            pa.ArrowInvalid: If a float column only holds integer literals.
+        """
+        floats = [field.name for field in schema if pa.types.is_floating(field.type)]
+        if not floats:
+            return
+        convert_options = pacsv.ConvertOptions(
+            include_columns=floats,
+            column_types={name: pa.string() for name in floats},
+            null_values=NULL_VALUES,
+            strings_can_be_null=True,
+        )
+        with pacsv.open_csv(path, convert_options=convert_options) as stream:
+            for batch in stream:
+                for name, column in zip(batch.schema.names, batch.columns):
+                    integers = pc.match_substring_regex(  # pylint: disable=no-member
+                        column, f"^{INT_PATTERN.pattern}$"
+                    )
+                    # nulls are skipped, a column of nulls only is all null
+                    if pc.all(integers).as_py():  # pylint: disable=no-member
+                        raise pa.ArrowInvalid(f"{name} holds integers beyond int64")
+                break
+
+    @staticmethod
+    def _nullable_ints_to_float(table: "pa.Table") -> "pa.Table":
+        """
+        Cast int columns holding nulls to float64, the dtype pandas gives them, so a subset
+        of the rows converts to the same dtypes as the whole Table.
+
+        Args
+        ----
+            - table (pa.Table): The rows to cast.
+
+        Returns
+        -------
+            pa.Table: The rows with int columns holding nulls cast to float64.
+        """
+        for index, field in enumerate(table.schema):
+            if pa.types.is_integer(field.type) and table.column(index).null_count:
+                column = table.column(index).cast(pa.float64())
+                table = table.set_column(index, field.name, column)
+        return table
+
+    @staticmethod
+    def _to_pandas(table: "pa.Table", offset: int = 0) -> pd.DataFrame:
+        """
+        Convert a pyarrow Table holding rows offset onwards of a CSV file to a pandas DataFrame
+        indexed the way pandas' own chunked reader would.
+
+        Args
+        ----
+            - table (pa.Table): The rows to convert.
+            - offset (int): The position of the first row in the CSV file. Default is 0.
+
+        Returns
+        -------
+            pd.DataFrame: The converted rows.
+        """
+        dataframe = table.to_pandas()
+        dataframe.index = pd.RangeIndex(offset, offset + len(dataframe))
+        return dataframe
+
+    @staticmethod
+    def _arrow_tables(
+        path: str, chunksize: int, usecols: Optional[List[str]] = None
+    ) -> Iterator[Union["pa.Table", pd.DataFrame]]:
+        """
+        Stream a CSV file through pyarrow's block reader in pyarrow Tables of chunksize rows.
+        If a later block does not fit the inferred schema the rest of the file is read with
+        pandas instead & handed out as pandas DataFrames.
+
+        Args
+        ----
+            - path (str): The path to the CSV file.
+            - chunksize (int): The number of rows per Table.
+            - usecols (List[str]): Only parse these columns. Default is None (all columns).
 
         Returns
         -------
-            pd.DataFrame: The DataFrame created from the CSV file.
+            Iterator[Union[pa.Table, pd.DataFrame]]: The chunks of the CSV file.
+
+        Raises
+        ------
+            argparse.ArgumentTypeError: If chunksize is not a positive integer.
+        """
+        chunksize = Terminal._positive_int(chunksize)
+        emitted, buffered = 0, []
+        try:
+            convert_options = Terminal._arrow_options(path, usecols)
+            with pacsv.open_csv(path, convert_options=convert_options) as stream:
+                for batch in stream:
+                    buffered.append(batch)
+                    table = pa.Table.from_batches(buffered, schema=stream.schema)
+                    while table.num_rows >= chunksize:
+                        emitted += chunksize
+                        yield table.slice(0, chunksize)
+                        table = table.slice(chunksize)
+                    buffered = table.to_batches()
+                if buffered:
+                    yield pa.Table.from_batches(buffered)
+        except pa.ArrowInvalid:
+            for chunk in pd.read_csv(
+                path,
+                chunksize=chunksize,
+                usecols=usecols,
+                skiprows=range(1, emitted + 1),
+            ):
+                chunk.index = chunk.index + emitted
+                yield chunk
+
+    @staticmethod
+    def _arrow_chunks(
+        path: str, chunksize: int, usecols: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
         """
-        return pd.read_csv(path)
+        Stream a CSV file through pyarrow's block reader & hand it out as pandas DataFrames
+        of chunksize rows.
+
+        Args
+        ----
+            - path (str): The path to the CSV file.
+            - chunksize (int): The number of rows per DataFrame.
+            - usecols (List[str]): Only parse these columns. Default is None (all columns).
+
+        Returns
+        -------
+            Iterator[pd.DataFrame]: The chunks of the CSV file.
+        """
+        offset = 0
+        for chunk in Terminal._arrow_tables(path, chunksize, usecols):
+            if not isinstance(chunk, pd.DataFrame):
+                chunk = Terminal._to_pandas(chunk, offset)
+            offset += len(chunk)
+            yield chunk
+
+
+class CompiledFilter(NamedTuple):
+    """
+    A command line filter parsed once into its column, operator & typed value.
+    """
+
+    column: str
+    operator: Optional[str]
+    value: Any
+
+    def __call__(self, values: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the filter against column values.
+
+        Args
+        ----
+            - values (np.ndarray): The column values we are operating on (parsed from CSV).
+
+        Returns
+        -------
+            np.ndarray: The boolean mask for the filter condition.
+        """
+        return Feel._convert_filter(values, self.operator, self.value)
 
 
 class Feel(Terminal):
@@ -214,83 +633,430 @@ class Feel(Terminal):
     A class for performing primitive filter operations on a CSV file.
     """
 
+    @staticmethod
     def _convert_filter(
-        dataframe: pd.DataFrame, column: str, operator: str, filter_val: str
-    ) -> pd.Series:
+        values: np.ndarray, operator: Optional[str], filter_val: Any
+    ) -> np.ndarray:
         """
         Create a pandas filter from a command line filter.
 
         Args
         ----
-            - dataframe (pd.DataFrame): The dataframe we are operating on (parsed from CSV).
-            - column (str): The column we want to filter by.
+            - values (np.ndarray): The column values we are operating on (parsed from CSV).
             - operator (str): The filtering operator (~, <, >).
-            - filter_val (str): The column value we want to filter by.
+            - filter_val (Any): The column value we want to filter by.
 
         Returns
         -------
-            pd.Series: The pandas filter condition.
+            np.ndarray: The boolean mask for the filter condition.
         """
-        if isinstance(filter_val, list):
-            if operator == "~":
-                return ~(dataframe[column].isin(filter_val))
-            return dataframe[column].isin(filter_val)
-        if operator == "~":
-            return ~(dataframe[column] == filter_val)
-        if operator == ">":
-            return dataframe[column] > filter_val
-        if operator == "<":
-            return dataframe[column] < filter_val
-        return dataframe[column] == filter_val
+        if (
+            numexpr is not None
+            and values.size >= NUMEXPR_MIN_ELEMENTS
+            and values.dtype in NUMEXPR_DTYPES
+            and isinstance(filter_val, (int, float))
+        ):
+            return numexpr.evaluate(
+                NUMEXPR_EXPRESSIONS[operator],
+                local_dict={"values": values, "filter_val": filter_val},
+            )
+        series = pd.Series(values, copy=False)
+        if Feel._short_isin(values.dtype, filter_val):
+            # comparing against each value beats building pandas' hashtable for short lists
+            mask = np.isin(values, filter_val)
+        elif isinstance(filter_val, (np.ndarray, frozenset)):
+            mask = series.isin(filter_val).to_numpy()
+        elif operator == ">":
+            mask = (series > filter_val).to_numpy()
+        elif operator == "<":
+            mask = (series < filter_val).to_numpy()
+        else:
+            mask = (series == filter_val).to_numpy()
+        return ~mask if operator == "~" else mask
 
     @staticmethod
-    def _column_filter(
-        dataframe: pd.DataFrame,
-        filter_val: str,
-        column: str,
-        operator: Optional[str] = None,
-    ) -> pd.Series:
+    def _short_isin(dtype: np.dtype, filter_val: Any) -> bool:
         """
-        Parse command line filter and convert it to a pandas filter condition.
+        Check whether an IS IN filter should be evaluated with np.isin, which compares
+        numeric columns against each value of a short list (no NaN, that pandas matches).
+
+        Args
+        ----
+            - dtype (np.dtype): The dtype of the column we are operating on.
+            - filter_val (Any): The column value we want to filter by.
+
+        Returns
+        -------
+            bool: True if np.isin should be used, False otherwise.
+        """
+        return (
+            isinstance(filter_val, np.ndarray)
+            and len(filter_val) <= SHORT_LIST
+            and dtype.kind in "iuf"
+            and not np.isnan(filter_val).any()
+        )
+
+    @staticmethod
+    def _arrow_kernel_fits(column_type: "pa.DataType", filter_val: Any) -> bool:
+        """
+        Check whether a filter value is of the same kind as a pyarrow column, numbers for
+        int / float columns & strings for string columns, so compute kernels compare them
+        the way pandas does.
+
+        Args
+        ----
+            - column_type (pa.DataType): The type of the column we are operating on.
+            - filter_val (Any): The column value we want to filter by.
+
+        Returns
+        -------
+            bool: True if pyarrow compute kernels can be used, False otherwise.
+        """
+        if isinstance(filter_val, (np.ndarray, int, float)):
+            return pa.types.is_integer(column_type) or pa.types.is_floating(column_type)
+        return pa.types.is_string(column_type) or pa.types.is_large_string(column_type)
+
+    @staticmethod
+    def _convert_filter_arrow(
+        column: "pa.ChunkedArray", operator: Optional[str], filter_val: Any
+    ) -> np.ndarray:
+        """
+        Create a filter mask with pyarrow compute kernels, nulls never match like NaN in
+        pandas. Falls back to the pandas filter when no kernel fits the column & value types.
+
+        Args
+        ----
+            - column (pa.ChunkedArray): The column values we are operating on (parsed from CSV).
+            - operator (str): The filtering operator (~, <, >).
+            - filter_val (Any): The column value we want to filter by.
+
+        Returns
+        -------
+            np.ndarray: The boolean mask for the filter condition.
+        """
+        if isinstance(filter_val, np.ndarray) and np.isnan(filter_val).any():
+            # pandas reads missing values as NaN, which a NaN in the list matches, but nulls
+            # of string columns come out of pyarrow as None
+            mask = Feel._convert_filter(column.to_numpy(), None, filter_val)
+            mask |= column.is_null().to_numpy()
+            return ~mask if operator == "~" else mask
+        # short numeric lists compare faster in numpy, values of another kind than the column
+        # would be cast to its type by pyarrow (e.g. 7 to true on a bool column)
+        if not Feel._arrow_kernel_fits(column.type, filter_val) or Feel._short_isin(
+            np.dtype(column.type.to_pandas_dtype()), filter_val
+        ):
+            return Feel._convert_filter(column.to_numpy(), operator, filter_val)
+        try:
+            if isinstance(filter_val, (np.ndarray, frozenset)):
+                value_set = pa.array(
+                    list(filter_val)
+                    if isinstance(filter_val, frozenset)
+                    else filter_val
+                )
+                mask = pc.is_in(  # pylint: disable=no-member
+                    column, value_set=value_set
+                )
+            else:
+                mask = getattr(pc, ARROW_KERNELS[operator])(column, filter_val)
+        except (pa.ArrowException, TypeError, OverflowError):
+            # e.g. a string value on a numeric column or an int literal beyond int64
+            return Feel._convert_filter(column.to_numpy(), operator, filter_val)
+        mask = pc.fill_null(mask, False).to_numpy()
+        return ~mask if operator == "~" else mask
+
+    @staticmethod
+    @lru_cache(maxsize=COMPILED_CACHE_SIZE)
+    def _compile_filter(
+        column: str, filter_val: str, operator: Optional[str] = None
+    ) -> CompiledFilter:
+        """
+        Parse command line filter value once & compile it into a callable filter over column
+        values, so applying it to every chunk of a CSV only costs the array operations.
+        Compiled filters are cached, repeated runs in one process reuse them.
 
         Args
         ----
-            dataframe (pd.DataFrame): The dataframe we are operating on (parsed from CSV).
-            filter_val (str): The column value we want to filter by.
             column (str): The column we want to filter by.
+            filter_val (str): The column value we want to filter by.
             operator (str): The filtering operator (~, <, >, |).
 
         Returns
         -------
-            pd.Series: The pandas filter condition.
+            CompiledFilter: The filter, called with column values it returns the boolean mask.
         """
-        float_val = Operations.can_float(filter_val)
-        int_val = Operations.can_int(filter_val)
-        list_val = "|" in filter_val
-        if float_val or int_val:
-            if Operations.can_float(filter_val):
-                return Feel._convert_filter(
-                    dataframe, column, operator, float(filter_val)
-                )
-            return Feel._convert_filter(dataframe, column, operator, int(filter_val))
-        if list_val:
+        if "|" in filter_val:
             multi_val = filter_val.split("|")
-            float_list, int_list = Operations.can_float(
-                multi_val[0]
-            ), Operations.can_int(filter_val[0])
-            if float_list or int_list:
-                if float_list:
-                    converted_multi_val = [float(val) for val in multi_val]
-                else:
-                    converted_multi_val = [int(val) for val in multi_val]
-                return Feel._column_filter(
-                    dataframe, converted_multi_val, column, operator
+            # typed arrays / sets let pandas build its lookup hashtable without boxing, values
+            # are classified like scalars (numpy alone would also accept "1_0" or " 1")
+            if all(INT_PATTERN.fullmatch(val) for val in multi_val):
+                try:
+                    filter_val = np.array(multi_val, dtype=np.int64)
+                except OverflowError:
+                    filter_val = np.array(multi_val, dtype=np.float64)
+            elif all(
+                INT_PATTERN.fullmatch(val) or FLOAT_PATTERN.fullmatch(val)
+                for val in multi_val
+            ):
+                filter_val = np.array(multi_val, dtype=np.float64)
+            else:
+                filter_val = frozenset(multi_val)
+        elif INT_PATTERN.fullmatch(filter_val):
+            filter_val = int(filter_val)
+            # like pipe lists, ints that don't fit a column dtype are compared as floats
+            if not INT64_MIN <= filter_val <= INT64_MAX:
+                filter_val = float(filter_val)
+        elif FLOAT_PATTERN.fullmatch(filter_val):
+            filter_val = float(filter_val)
+        return CompiledFilter(column, operator, filter_val)
+
+    @staticmethod
+    def _cost(spec: CompiledFilter, dtype: np.dtype) -> int:
+        """
+        Rough relative cost of evaluating a filter: comparisons against numeric columns are
+        cheapest, string comparisons hash / compare objects & IS IN builds a lookup table.
+
+        Args
+        ----
+            spec (CompiledFilter): The compiled filter.
+            dtype (np.dtype): The dtype of the column it filters.
+
+        Returns
+        -------
+            int: The cost, from 1 (numeric comparison) to 4 (long IS IN list).
+        """
+        if isinstance(spec.value, (np.ndarray, frozenset)):
+            return 3 if len(spec.value) <= SHORT_LIST else 4
+        if dtype.kind in "iufb":
+            return 1
+        return 2
+
+    @staticmethod
+    def _order_filters(
+        compiled: List[CompiledFilter], sample: pd.DataFrame, nrows: int
+    ) -> List[CompiledFilter]:
+        """
+        Order filters so the cheapest & most selective ones are evaluated first. On data
+        larger than SAMPLE_ROWS each filter is tried on the first SAMPLE_ROWS rows & ranked by
+        its cost divided by the fraction of rows it removed, otherwise by cost alone.
+
+        Args
+        ----
+            compiled (List[CompiledFilter]): The compiled filters.
+            sample (pd.DataFrame): The first rows of the data to filter (at most SAMPLE_ROWS).
+            nrows (int): The number of rows in the data to filter.
+
+        Returns
+        -------
+            List[CompiledFilter]: The filters in evaluation order.
+        """
+
+        def rank(spec: CompiledFilter) -> float:
+            cost = Feel._cost(spec, sample[spec.column].dtype)
+            if nrows <= SAMPLE_ROWS:
+                return cost
+            removed = 1.0 - spec(sample[spec.column].to_numpy()).mean()
+            return cost / max(removed, 1 / SAMPLE_ROWS)
+
+        return sorted(compiled, key=rank)
+
+    @staticmethod
+    def _compile_filters(
+        filters: List[Any], columns: Union[List[str], pd.Index]
+    ) -> Tuple[List[CompiledFilter], List[str]]:
+        """
+        Validate command line filters & compile them into callable filters.
+
+        Args
+        ----
+            - filters (List[Any]): The list of filter values to apply.
+            - columns (Union[List[str], pd.Index]): The column names in the dataframe.
+
+        Returns
+        -------
+            Tuple[List[CompiledFilter], List[str]]: A tuple containing the compiled filters
+                                            and the list of columns used for filtering.
+
+        Raises
+        ------
+            argparse.ArgumentTypeError: If a filter value is not in the correct format or if a column
+                                        is not valid.
+        """
+        compiled = []
+        in_use = []
+        # pd.Index lookups already go through its hashtable, only plain lists need a set
+        known_columns = columns if isinstance(columns, pd.Index) else set(columns)
+        # a filter given twice would only test the same rows again
+        for value in dict.fromkeys(filters):
+            split = value.split(":", 1)
+            # filter type
+            if len(split) != 2:
+                raise argparse.ArgumentTypeError(
+                    f"{value} is not a valid column filter.\n" + "{FILTER_TYPES}"
+                )
+            column, filter_val = split[0], split[1]
+            in_use.append(column)
+            if column not in known_columns:
+                raise argparse.ArgumentTypeError(
+                    f"{column} is not a valid column.\n"
+                    + f"Use one of: {list(columns)}"
+                )
+            # parse operator, operators are always the leading character of the value
+            operator = filter_val[:1] if filter_val[:1] in PREFIX_OPERATORS else None
+            stripped_val = filter_val[1:] if operator else filter_val
+            compiled.append(Feel._compile_filter(column, stripped_val, operator))
+        return compiled, in_use
+
+    @staticmethod
+    def _fusable_filters(
+        compiled: List[CompiledFilter], dataframe: pd.DataFrame
+    ) -> Tuple[List[CompiledFilter], List[CompiledFilter]]:
+        """
+        Split off the filters that numexpr can evaluate together in a single pass: finite
+        numeric comparisons against numeric columns. Nothing is fused for small dataframes,
+        without numexpr or when there is less than two such filters.
+
+        Args
+        ----
+            - compiled (List[CompiledFilter]): The compiled filters.
+            - dataframe (pd.DataFrame): The dataframe to filter.
+
+        Returns
+        -------
+            Tuple[List[CompiledFilter], List[CompiledFilter]]: The filters to evaluate with
+                                            DataFrame.query and the ones left to evaluate one by one.
+        """
+        if numexpr is None or len(dataframe) < NUMEXPR_MIN_ELEMENTS:
+            return [], compiled
+        fused, rest = [], []
+        for spec in compiled:
+            if (
+                isinstance(spec.value, (int, float))
+                and math.isfinite(spec.value)
+                and "`" not in spec.column
+                and dataframe[spec.column].dtype in NUMEXPR_DTYPES
+            ):
+                fused.append(spec)
+            else:
+                rest.append(spec)
+        if len(fused) < 2:
+            return [], compiled
+        return fused, rest
+
+    @staticmethod
+    def _build_query_string(compiled: List[CompiledFilter]) -> str:
+        """
+        Combine compiled numeric filters into one DataFrame.query expression.
+
+        Args
+        ----
+            - compiled (List[CompiledFilter]): The compiled filters.
+
+        Returns
+        -------
+            str: The query expression, e.g. (`col1` > 1.5) & (`col2` != 3)
+        """
+        return " & ".join(
+            f"(`{spec.column}` {QUERY_OPERATORS[spec.operator]} {spec.value!r})"
+            for spec in compiled
+        )
+
+    @staticmethod
+    def _apply_filters(
+        compiled: List[CompiledFilter], dataframe: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Apply compiled filters to a dataframe, testing each filter only against the rows
+        that survived the previous ones.
+
+        Args
+        ----
+            - compiled (List[CompiledFilter]): The compiled filters.
+            - dataframe (pd.DataFrame): The dataframe to filter.
+
+        Returns
+        -------
+            pd.DataFrame: The filtered dataframe.
+        """
+        fused, compiled = Feel._fusable_filters(compiled, dataframe)
+        if fused:
+            try:
+                dataframe = dataframe.query(
+                    Feel._build_query_string(fused), engine="numexpr"
                 )
-            return Feel._column_filter(dataframe, multi_val, column, operator)
-        return Feel._convert_filter(dataframe, column, operator, filter_val)
+            except (SyntaxError, ValueError):
+                # query can't parse some column names (e.g. "Order #"), use the masks instead
+                compiled = fused + compiled
+        compiled = Feel._order_filters(
+            compiled, dataframe.head(SAMPLE_ROWS), len(dataframe)
+        )
+        active_idx, arrays = None, {}
+        for spec in compiled:
+            # one array per column, however many filters it has
+            if spec.column not in arrays:
+                arrays[spec.column] = dataframe[spec.column].to_numpy()
+            values = arrays[spec.column]
+            if active_idx is None:
+                active_idx = np.flatnonzero(spec(values))
+            else:
+                active_idx = active_idx[spec(values[active_idx])]
+            if active_idx.size == 0:
+                break
+        if active_idx is None:
+            return dataframe
+        return dataframe.iloc[active_idx]
+
+    @staticmethod
+    def _apply_filters_arrow(
+        compiled: List[CompiledFilter], table: "pa.Table", offset: int = 0
+    ) -> pd.DataFrame:
+        """
+        Apply compiled filters to a pyarrow Table with pyarrow compute kernels. Filters run
+        over whole columns & are AND-ed until fewer than ARROW_NARROW_FRACTION of the rows
+        survive, from then on each filter only tests the surviving rows. Only the surviving
+        rows are converted to pandas.
+
+        Args
+        ----
+            - compiled (List[CompiledFilter]): The compiled filters.
+            - table (pa.Table): The rows to filter.
+            - offset (int): The position of the first row in the CSV file. Default is 0.
+
+        Returns
+        -------
+            pd.DataFrame: The filtered dataframe, indexed by row position in the CSV file.
+        """
+        sample = table.slice(0, SAMPLE_ROWS if table.num_rows > SAMPLE_ROWS else 0)
+        sample = sample.select(list(dict.fromkeys(spec.column for spec in compiled)))
+        compiled = Feel._order_filters(compiled, sample.to_pandas(), table.num_rows)
+        mask = positions = None
+        for spec in compiled:
+            column = table.column(spec.column)
+            if positions is not None:
+                column = column.take(positions)
+            current = Feel._convert_filter_arrow(column, spec.operator, spec.value)
+            if positions is not None:
+                positions = positions[current]
+            else:
+                mask = current if mask is None else np.logical_and(mask, current)
+                if np.count_nonzero(mask) < table.num_rows * ARROW_NARROW_FRACTION:
+                    positions = np.flatnonzero(mask)
+            if positions is not None and positions.size == 0:
+                break
+        if mask is None:
+            return Feel._to_pandas(table, offset)
+        table = Feel._nullable_ints_to_float(table)
+        if positions is None:
+            # many rows survive, a boolean filter copies them faster than gathering
+            positions = np.flatnonzero(mask)
+            table = table.filter(pa.array(mask))
+        else:
+            table = table.take(positions)
+        dataframe = table.to_pandas()
+        dataframe.index = offset + positions
+        return dataframe
 
     def filtering(
-        filters: List[Any], dataframe: pd.DataFrame, columns: str
+        filters: List[Any], dataframe: pd.DataFrame, columns: Union[List[str], pd.Index]
     ) -> Tuple[pd.DataFrame, List[str]]:
         """
         Verify a filter value is of the right format
@@ -299,7 +1065,7 @@ class Feel(Terminal):
         ----
             - filters (List[Any]): The list of filter values to apply.
             - dataframe (pd.DataFrame): The dataframe to filter.
-            - columns (List[str]): The list of column names in the dataframe.
+            - columns (Union[List[str], pd.Index]): The column names in the dataframe.
 
         Returns
         -------
@@ -326,57 +1092,320 @@ class Feel(Terminal):
 
         "col_name:~filter_vals|filter_vals"       col_name IS NOT IN [val1, val2]         [number, string]
         """
-        concatenated = []
-        in_use = []
-        for value in filters:
-            split = value.split(":", 1)
-            # filter type
-            if len(split) != 2:
-                raise argparse.ArgumentTypeError(
-                    f"{value} is not a valid column filter.\n" + "{FILTER_TYPES}"
-                )
-            column, filter_val = split[0], split[1]
-            in_use.append(column)
-            if column not in columns:
-                raise argparse.ArgumentTypeError(
-                    f"{column} is not a valid column.\n" + f"Use one of: {columns}"
+        compiled, in_use = Feel._compile_filters(filters, columns)
+        return Feel._apply_filters(compiled, dataframe), in_use
+
+    @staticmethod
+    def _prepare(
+        path: str, filters: List[Any], columns: Optional[List[str]] = None
+    ) -> Tuple[List[CompiledFilter], List[str], pd.DataFrame]:
+        """
+        Read the header of a CSV file, compile the filters against it & work out which columns
+        have to be parsed.
+
+        Args
+        ----
+            - path (str): The path to the CSV file.
+            - filters (List[Any]): The list of filter values to apply.
+            - columns (List[str]): Columns to read on top of the ones used for filtering, the
+                                   rest are never parsed. Default is None (all columns).
+
+        Returns
+        -------
+            Tuple[List[CompiledFilter], List[str], pd.DataFrame]: A tuple containing the compiled
+                                            filters, the list of columns used for filtering and
+                                            the (empty) header frame of the columns to parse.
+
+        Raises
+        ------
+            argparse.ArgumentTypeError: If a filter value is not in the correct format or if a column
+                                        is not valid.
+        """
+        header = pd.read_csv(path, nrows=0)
+        compiled, in_use = Feel._compile_filters(filters, header.columns)
+        if columns is not None:
+            for column in columns:
+                if column not in header.columns:
+                    raise argparse.ArgumentTypeError(
+                        f"{column} is not a valid column.\n"
+                        + f"Use one of: {list(header.columns)}"
+                    )
+            header = header[[col for col in header.columns if col in in_use + columns]]
+        return compiled, in_use, header
+
+    @staticmethod
+    def _filter_chunks(
+        path: str,
+        compiled: List[CompiledFilter],
+        chunksize: int = CHUNKSIZE,
+        usecols: Optional[List[str]] = None,
+        keep: Optional[List[str]] = None,
+    ) -> Iterator[Tuple[pd.DataFrame, Optional[pd.DataFrame]]]:
+        """
+        Read a CSV file chunk by chunk & apply compiled filters to every chunk. With pyarrow
+        installed the filters run on pyarrow Tables & only surviving rows reach pandas. Chunks
+        are filtered in a thread pool while the following ones are read, in file order, with
+        at most FILTER_WORKERS + 1 chunks in flight.
+
+        Args
+        ----
+            - path (str): The path to the CSV file.
+            - compiled (List[CompiledFilter]): The compiled filters.
+            - chunksize (int): The number of rows read at a time. Default is CHUNKSIZE.
+            - usecols (List[str]): Only parse these columns. Default is None (all columns).
+            - keep (List[str]): Also hand out the unfiltered values of these columns. Default
+                                is None.
+
+        Returns
+        -------
+            Iterator[Tuple[pd.DataFrame, Optional[pd.DataFrame]]]: Pairs of filtered rows & the
+                                            unfiltered keep columns (None unless keep) per chunk.
+        """
+        if pacsv is None:
+            chunks = Feel.reader(path, chunksize=chunksize, usecols=usecols)
+        else:
+            chunks = Feel._arrow_tables(path, chunksize, usecols)
+        offset, pending = 0, deque()
+        with ThreadPoolExecutor(max_workers=FILTER_WORKERS) as executor:
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(Feel._filter_chunk, compiled, chunk, offset, keep)
                 )
-            # parse operator / convert to pandas friendly format
-            has_operator = any(
-                operator for operator in FILTER_OPERATORS if operator in filter_val
+                offset += len(chunk)
+                if len(pending) > FILTER_WORKERS:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def _filter_chunk(
+        compiled: List[CompiledFilter],
+        chunk: Union["pa.Table", pd.DataFrame],
+        offset: int,
+        keep: Optional[List[str]] = None,
+    ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+        """
+        Apply compiled filters to one chunk of a CSV file.
+
+        Args
+        ----
+            - compiled (List[CompiledFilter]): The compiled filters.
+            - chunk (Union[pa.Table, pd.DataFrame]): The rows to filter.
+            - offset (int): The position of the first row in the CSV file.
+            - keep (List[str]): Also hand out the unfiltered values of these columns. Default
+                                is None.
+
+        Returns
+        -------
+            Tuple[pd.DataFrame, Optional[pd.DataFrame]]: The filtered rows & the unfiltered
+                                                        keep columns (None unless keep).
+        """
+        if isinstance(chunk, pd.DataFrame):
+            return Feel._apply_filters(compiled, chunk), chunk[keep] if keep else None
+        filtered = Feel._apply_filters_arrow(compiled, chunk, offset)
+        return filtered, Feel._to_pandas(chunk.select(keep), offset) if keep else None
+
+    @staticmethod
+    def _reservoir(
+        reservoir: Optional[pd.DataFrame],
+        chunk: pd.DataFrame,
+        seen: int,
+        size: int,
+        rng: np.random.Generator,
+    ) -> pd.DataFrame:
+        """
+        Update a uniform random sample of streamed rows with the next chunk of rows, using
+        reservoir sampling (Algorithm R) vectorized over the chunk. See link below for more
+        info :-
+        https://en.wikipedia.org/wiki/Reservoir_sampling#Simple:_Algorithm_R
+
+        Args
+        ----
+            - reservoir (pd.DataFrame): The sample so far, None before the first chunk.
+            - chunk (pd.DataFrame): The next rows of the stream.
+            - seen (int): The number of rows streamed so far, including chunk.
+            - size (int): The number of rows to sample.
+            - rng (np.random.Generator): The random number generator.
+
+        Returns
+        -------
+            pd.DataFrame: The sample of all rows streamed so far.
+        """
+        fill = min(
+            max(size - (0 if reservoir is None else len(reservoir)), 0), len(chunk)
+        )
+        filled = chunk.iloc[:fill]
+        reservoir = filled if reservoir is None else pd.concat([reservoir, filled])
+        rest = chunk.iloc[fill:]
+        # the t-th row of the stream (from 0) replaces a random slot with probability size/(t+1)
+        slots = rng.integers(0, np.arange(seen - len(rest), seen) + 1)
+        rows = np.flatnonzero(slots < size)
+        if rows.size == 0:
+            return reservoir
+        # a slot drawn by several rows of the chunk ends up holding the last of them
+        slots, last = np.unique(slots[rows][::-1], return_index=True)
+        rows = rows[::-1][last]
+        take = np.arange(len(reservoir))
+        take[slots] = len(reservoir) + np.arange(len(rows))
+        return pd.concat([reservoir, rest.iloc[rows]]).iloc[take]
+
+    @staticmethod
+    def filter_streaming(  # pylint: disable=too-many-arguments,too-many-locals
+        path: str,
+        filters: List[Any],
+        chunksize: int = CHUNKSIZE,
+        keep_original: bool = False,
+        columns: Optional[List[str]] = None,
+        sample: Optional[int] = None,
+    ) -> Tuple[pd.DataFrame, List[str], Optional[pd.DataFrame]]:
+        """
+        Filter a CSV file chunk by chunk so only the surviving rows are ever held in memory,
+        or only a random sample of them when sample is given.
+
+        Args
+        ----
+            - path (str): The path to the CSV file.
+            - filters (List[Any]): The list of filter values to apply.
+            - chunksize (int): The number of rows read at a time. Default is CHUNKSIZE.
+            - keep_original (bool): Also collect the unfiltered values of the columns used for
+                                    filtering. Default is False.
+            - columns (List[str]): Columns to read on top of the ones used for filtering, the
+                                   rest are never parsed. Default is None (all columns).
+            - sample (int): Only keep a uniform random sample of this many filtered rows (all
+                            of them if fewer survive). Default is None (keep every row).
+
+        Returns
+        -------
+            Tuple[pd.DataFrame, List[str], Optional[pd.DataFrame]]: A tuple containing the filtered
+                                            dataframe, the list of columns used for filtering and
+                                            the unfiltered filter columns (None unless keep_original).
+
+        Raises
+        ------
+            argparse.ArgumentTypeError: If a filter value is not in the correct format or if a column
+                                        is not valid.
+        """
+        compiled, in_use, header = Feel._prepare(path, filters, columns)
+        usecols = None if columns is None else list(header.columns)
+        keep = list(dict.fromkeys(in_use)) if keep_original else None
+        filtered_chunks, original_chunks = [], []
+        rng, seen = np.random.default_rng(), 0
+        for filtered, original in Feel._filter_chunks(
+            path, compiled, chunksize, usecols, keep
+        ):
+            if sample is not None:
+                seen += len(filtered)
+                reservoir = filtered_chunks.pop() if filtered_chunks else None
+                filtered = Feel._reservoir(reservoir, filtered, seen, sample, rng)
+            filtered_chunks.append(filtered)
+            if keep_original:
+                original_chunks.append(original)
+        filtered = pd.concat(filtered_chunks) if filtered_chunks else header
+        original = None
+        if keep_original:
+            original = (
+                pd.concat(original_chunks)
+                if original_chunks
+                else header[list(dict.fromkeys(in_use))]
             )
-            if has_operator:
-                if "~" in filter_val:
-                    operator, stripped_val = (
-                        "~",
-                        filter_val.split("~")[1],
-                    )
-                    concatenated.append(
-                        Feel._column_filter(dataframe, stripped_val, column, operator)
-                    )
-                elif ">" in filter_val:
-                    operator, stripped_val = (
-                        ">",
-                        filter_val.split(">")[1],
-                    )
-                    concatenated.append(
-                        Feel._column_filter(dataframe, stripped_val, column, operator)
-                    )
-                elif "<" in filter_val:
-                    operator, stripped_val = (
-                        "<",
-                        filter_val.split("<")[1],
-                    )
-                    concatenated.append(
-                        Feel._column_filter(dataframe, stripped_val, column, operator)
-                    )
-                else:
-                    concatenated.append(
-                        Feel._column_filter(dataframe, filter_val, column)
-                    )
-            else:
-                concatenated.append(Feel._column_filter(dataframe, filter_val, column))
-        return dataframe[Operations.conjunction(*concatenated)], in_use
+        return filtered, in_use, original
+
+    @staticmethod
+    def _rewrite_floats(path: str, columns: set, chunksize: int = CHUNKSIZE):
+        """
+        Rewrite columns of a CSV file written by pandas as floats (4 becomes 4.0), leaving
+        every other value as it is.
+
+        Args
+        ----
+            - path (str): The path to the CSV file.
+            - columns (set): The columns to rewrite as floats.
+            - chunksize (int): The number of rows read at a time. Default is CHUNKSIZE.
+        """
+        names = pd.read_csv(path, nrows=0).columns
+        dtypes = {name: "float64" if name in columns else str for name in names}
+        target = Feel._temp_path(path)
+        try:
+            written = False
+            for chunk in pd.read_csv(
+                path,
+                dtype=dtypes,
+                keep_default_na=False,
+                na_values=[""],
+                float_precision="round_trip",
+                chunksize=chunksize,
+            ):
+                Feel.writer(chunk, target, append=written)
+                written = True
+            shutil.copymode(path, target)
+            os.replace(target, path)
+        finally:
+            if os.path.exists(target):
+                os.remove(target)
+
+    @staticmethod
+    def filter_to_csv(  # pylint: disable=too-many-arguments,too-many-locals
+        path: str,
+        output: str,
+        filters: List[Any],
+        chunksize: int = CHUNKSIZE,
+        columns: Optional[List[str]] = None,
+        arrow: bool = False,
+    ):
+        """
+        Filter a CSV file chunk by chunk & append the surviving rows of every chunk straight to
+        the output CSV, so the filtered result is never held in memory as a whole.
+
+        Args
+        ----
+            - path (str): The path to the input CSV file.
+            - output (str): The path to the output CSV file.
+            - filters (List[Any]): The list of filter values to apply.
+            - chunksize (int): The number of rows read at a time. Default is CHUNKSIZE.
+            - columns (List[str]): Columns to write to the output CSV, the rest are never
+                                   parsed. Default is None (all columns).
+            - arrow (bool): Write the output CSV with pyarrow. Default is False.
+
+        Raises
+        ------
+            argparse.ArgumentTypeError: If a filter value is not in the correct format or if a column
+                                        is not valid.
+        """
+        compiled, _, header = Feel._prepare(path, filters, columns)
+        usecols = None if columns is None else list(header.columns)
+        # writing over the input while it is still being read would lose rows
+        in_place = os.path.exists(output) and os.path.samefile(path, output)
+        target = Feel._temp_path(output) if in_place else output
+        try:
+            # pandas reads int columns with nulls as floats, so once a chunk has nulls the
+            # column stays float & the int rows written before are rewritten at the end
+            written, float_columns, int_written = False, set(), set()
+            for filtered, _ in Feel._filter_chunks(path, compiled, chunksize, usecols):
+                if columns is not None:
+                    filtered = filtered[columns]
+                float_columns.update(filtered.select_dtypes("floating").columns)
+                ints = filtered.select_dtypes("integer").columns.intersection(
+                    list(float_columns)
+                )
+                if len(ints):
+                    filtered = filtered.astype(dict.fromkeys(ints, "float64"))
+                if not filtered.empty:
+                    int_written.update(filtered.select_dtypes("integer").columns)
+                Feel.writer(filtered, target, append=written, arrow=arrow)
+                written = True
+            if not written:
+                Feel.writer(
+                    header if columns is None else header[columns], target, arrow=arrow
+                )
+            if int_written & float_columns and not (arrow and pacsv is not None):
+                # pyarrow writes 4.0 as 4 anyway
+                Feel._rewrite_floats(target, int_written & float_columns, chunksize)
+            if in_place:
+                shutil.copymode(output, target)
+                os.replace(target, output)
+        finally:
+            if in_place and os.path.exists(target):
+                os.remove(target)
 
     @staticmethod
     def cli(cli_args: argparse.Namespace):
@@ -394,19 +1423,33 @@ class Feel(Terminal):
         if cli_args.input == "" or cli_args.output == "":
             print("valid path to input/output CSV is required")
             sys.exit()
-        # read CSV into a pandas dataframe + extract column names using pandas
-        original_dataframe: pd.DataFrame = Feel.reader(cli_args.input)
-        dataframe_columns: List[Any] = list(original_dataframe.columns)
-        # apply pandas filters on dataframe
-        filtered_dataframe, col_in_use = Feel.filtering(
-            cli_args.filter, original_dataframe, dataframe_columns
+        if not cli_args.verbose and cli_args.sample is None:
+            # nothing needs the filtered rows as a whole, write them out chunk by chunk
+            Feel.filter_to_csv(
+                cli_args.input,
+                cli_args.output,
+                cli_args.filter,
+                chunksize=cli_args.chunksize,
+                columns=cli_args.columns,
+                arrow=cli_args.arrow_writer,
+            )
+            return
+        # stream CSV through the filters, original values are only kept for --counts & only
+        # a reservoir of --sample rows is kept when sampling
+        filtered_dataframe, col_in_use, original_dataframe = Feel.filter_streaming(
+            cli_args.input,
+            cli_args.filter,
+            chunksize=cli_args.chunksize,
+            keep_original=cli_args.verbose and cli_args.counts,
+            columns=cli_args.columns,
+            sample=cli_args.sample,
         )
 
         if cli_args.sample is not None:
             print(f"\nsampled: {cli_args.sample} rows")
-            filtered_dataframe = filtered_dataframe.sample(n=cli_args.sample)
         if cli_args.verbose:
-            for col in col_in_use:
+            # columns filtered more than once (e.g. "col:>10" "col:<100") are counted once
+            for col in dict.fromkeys(col_in_use):
                 if cli_args.counts:
                     print(
                         f"\nOriginal Counts: {col}\n\n{original_dataframe[col].value_counts(normalize=cli_args.normalize).to_markdown()}"
@@ -414,4 +1457,6 @@ class Feel(Terminal):
                 print(
                     f"\nFiltered Counts: {col}\n\n{filtered_dataframe[col].value_counts(normalize=cli_args.normalize).to_markdown()}"
                 )
-        filtered_dataframe.to_csv(cli_args.output, index=False)
+        if cli_args.columns is not None:
+            filtered_dataframe = filtered_dataframe[cli_args.columns]
+        Feel.writer(filtered_dataframe, cli_args.output, arrow=cli_args.arrow_writer)
@@ -1,11 +1,15 @@
 """
 test_feel: tests for feel, a module to filter rows by column values in a CSV file
 """
+import argparse
 import csv
+import io
 
+import numpy as np
 import pandas as pd
 import pytest
 
+import feel
 from feel import Feel, Operations, Terminal
 
 
@@ -32,6 +36,11 @@ class TestOperations:
         assert not Operations.conjunction(*[1, 2, 3, 0])
         assert Operations.conjunction(*[True, True, True])
         assert not Operations.conjunction(*[True, True, True, False])
+        first, second = np.array([True, True, False]), np.array([True, False, True])
+        assert Operations.conjunction(first, second).tolist() == [True, False, False]
+        none = np.zeros(3, dtype=bool)
+        assert Operations.conjunction(none, first, second).tolist() == [False] * 3
+        assert first.tolist() == [True, True, False]
 
 
 class TestTerminal:
@@ -49,6 +58,16 @@ class TestTerminal:
             ["input.csv", "filtered.csv", "--filter", "ID:1234", "--filter", "Name:Doe"]
         )
         assert parsed.filter == ["ID:1234", "Name:Doe"]
+        parsed = parser.parse_args(
+            ["input.csv", "filtered.csv", "-f", "ID:1234", "--columns", "Name"]
+        )
+        assert parsed.columns == ["Name"]
+        assert not parsed.arrow_writer
+        for chunksize in ("0", "-1", "x"):
+            with pytest.raises(SystemExit):
+                parser.parse_args(
+                    ["in.csv", "out.csv", "-f", "ID:1", "--chunksize", chunksize]
+                )
 
     @pytest.mark.parametrize(
         "data",
@@ -69,6 +88,67 @@ class TestTerminal:
         dataframe = Terminal.reader(tmp_file)
         assert dataframe.equals(pd.DataFrame.from_dict(data))
 
+    @pytest.mark.parametrize("chunksize", [1, 2, 5])
+    def test_reader_chunks(self, tmp_path, chunksize):
+        """test CSV file reader in chunks"""
+        tmp_file = tmp_path / "test_reader.csv"
+        data = {
+            "ID": [123, 342, 123, 7],
+            "Name": ["Feel", "Feel", None, "Feel"],
+            "Date": ["2023-01-01", "2023-01-02", "2023-01-03", "2023-01-04"],
+        }
+
+        with open(tmp_file, "w", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(data.keys())
+            writer.writerows(zip(*data.values()))
+        chunks = list(Terminal.reader(tmp_file, chunksize=chunksize))
+        assert len(chunks) == -(-len(data["ID"]) // chunksize)
+        assert pd.concat(chunks).equals(pd.read_csv(tmp_file))
+        assert Terminal.reader(tmp_file, usecols=["ID"]).columns.tolist() == ["ID"]
+        with pytest.raises(argparse.ArgumentTypeError):
+            list(Terminal.reader(tmp_file, chunksize=0))
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            ({"ID": [123, 342], "Name": ["Feel, Good", None], "Score": [1.5, np.nan]}),
+            ({"ID": [123, 342], "Mixed": ["Feel", 1]}),
+            ({"Score": [239.0, 1.5], "Flag": [True, False]}),
+        ],
+    )
+    def test_writer(self, tmp_path, data):
+        """test CSV file writer"""
+        tmp_file = tmp_path / "test_writer.csv"
+        dataframe = pd.DataFrame.from_dict(data)
+        Terminal.writer(dataframe, tmp_file)
+        with open(tmp_file, encoding="utf-8", newline="") as csv_file:
+            assert csv_file.read() == dataframe.to_csv(index=False)
+        Terminal.writer(dataframe, tmp_file, append=True)
+        with open(tmp_file, encoding="utf-8", newline="") as csv_file:
+            assert csv_file.read() == dataframe.to_csv(index=False) + dataframe.to_csv(
+                index=False, header=False
+            )
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            ({"ID": [123, 342], "Name": ["Feel, Good", None], "Score": [1.5, np.nan]}),
+            ({"ID": [123, 342], "Mixed": ["Feel", 1]}),
+        ],
+    )
+    def test_writer_arrow(self, tmp_path, data):
+        """test CSV file writer with pyarrow writes the same values"""
+        pytest.importorskip("pyarrow")
+        tmp_file = tmp_path / "test_writer.csv"
+        dataframe = pd.DataFrame.from_dict(data)
+        Terminal.writer(dataframe, tmp_file, arrow=True)
+        written = pd.read_csv(tmp_file)
+        assert written.columns.tolist() == list(data.keys())
+        assert written.astype(str).equals(
+            pd.read_csv(io.StringIO(dataframe.to_csv(index=False))).astype(str)
+        )
+
 
 class TestFeel:
     """test feel, a CSV filtering package"""
@@ -174,6 +254,10 @@ class TestFeel:
             filters=["ID:124|123"], dataframe=dataframe, columns=list(data.keys())
         )
         assert filtered.shape == (2, 2)
+        filtered, _ = Feel.filtering(
+            filters=["Name:123|Feel"], dataframe=dataframe, columns=list(data.keys())
+        )
+        assert filtered.shape == (3, 2)
 
     @pytest.mark.parametrize(
         "data",
@@ -194,3 +278,243 @@ class TestFeel:
             filters=["ID:~124|123"], dataframe=dataframe, columns=list(data.keys())
         )
         assert filtered.shape == (1, 2)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            ({"ID": [123, 124, 125, 126], "Name": ["Feel", "Feel", "Leef", "Feel"]}),
+        ],
+    )
+    def test_filtering_combined(self, data):
+        """test CSV file filtering with several filters on the same dataframe"""
+        dataframe = pd.DataFrame.from_dict(data)
+        filtered, in_use = Feel.filtering(
+            filters=["ID:>123", "ID:124|125|126", "Name:Feel"],
+            dataframe=dataframe,
+            columns=list(data.keys()),
+        )
+        assert filtered["ID"].tolist() == [124, 126]
+        assert filtered.index.tolist() == [1, 3]
+        assert in_use == ["ID", "ID", "Name"]
+        filtered, _ = Feel.filtering(
+            filters=["Name:Nope", "ID:>123"],
+            dataframe=dataframe,
+            columns=list(data.keys()),
+        )
+        assert filtered.shape == (0, 2)
+        filtered, _ = Feel.filtering(
+            filters=["ID:>124"], dataframe=dataframe, columns=dataframe.columns
+        )
+        assert filtered.shape == (2, 2)
+        with pytest.raises(argparse.ArgumentTypeError):
+            Feel.filtering(["Nope:1"], dataframe, dataframe.columns)
+
+    @pytest.mark.parametrize("filter_val", ["ID:2.0", "ID:~2.0", "ID:>2.0", "ID:<2.0"])
+    def test_filtering_numexpr(self, monkeypatch, filter_val):
+        """test numeric comparisons routed through numexpr match pandas"""
+        pytest.importorskip("numexpr")
+        dataframe = pd.DataFrame.from_dict({"ID": [1.5, 2.0, np.nan, 4.0]})
+        expected, _ = Feel.filtering([filter_val], dataframe, ["ID"])
+        monkeypatch.setattr(feel, "NUMEXPR_MIN_ELEMENTS", 0)
+        filtered, _ = Feel.filtering([filter_val], dataframe, ["ID"])
+        assert filtered.equals(expected)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            (
+                {
+                    "ID": [123, 124, 125, 126, 127],
+                    "Name": ["Feel", "Leef", "Feel", "Feel", "Leef"],
+                }
+            ),
+        ],
+    )
+    def test_filter_streaming(self, tmp_path, data):
+        """test CSV file filtering chunk by chunk"""
+        tmp_file = tmp_path / "test_reader.csv"
+
+        with open(tmp_file, "w", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(data.keys())
+            writer.writerows(zip(*data.values()))
+        filtered, in_use, original = Feel.filter_streaming(
+            tmp_file, ["Name:Feel", "ID:>123"], chunksize=2, keep_original=True
+        )
+        assert filtered["ID"].tolist() == [125, 126]
+        assert in_use == ["Name", "ID"]
+        assert original.shape == (5, 2)
+        filtered, _, original = Feel.filter_streaming(tmp_file, ["Name:Nope"])
+        assert filtered.shape == (0, 2)
+        assert original is None
+        filtered, _, _ = Feel.filter_streaming(tmp_file, ["ID:>125"], columns=["ID"])
+        assert filtered.columns.tolist() == ["ID"]
+        with pytest.raises(argparse.ArgumentTypeError):
+            Feel.filter_streaming(tmp_file, ["ID:>125"], columns=["Nope"])
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            ["ID:>123", "Score:~4.5"],
+            ["Score:1.5|4.5", "Name:~Leef"],
+            ["ID:124|125.5", "Name:Feel|Leef"],
+            ["Name:123", "Score:<4"],
+            ["ID:~126"],
+            ["Score:nan|1.5"],
+            ["Name:nan|0"],
+            ["ID:<99999999999999999999"],
+            ["Flag:0|7"],
+            ["Flag:5|6"],
+            ["Flag:~1"],
+            ["Flag:5"],
+            ["Name:~nan|0"],
+            ["Score:~1.5|3.5"],
+        ],
+    )
+    @pytest.mark.parametrize("narrow_fraction", [0.1, 1.0])
+    def test_filter_streaming_arrow(
+        self, tmp_path, monkeypatch, filters, narrow_fraction
+    ):
+        """test filters run on pyarrow Tables match filters run on the whole dataframe"""
+        pytest.importorskip("pyarrow")
+        tmp_file = tmp_path / "test_reader.csv"
+        dataframe = pd.DataFrame.from_dict(
+            {
+                "ID": [123, 124, 125, 126, 127],
+                "Score": [1.5, np.nan, 3.5, 4.5, 1.5],
+                "Name": ["Feel", None, "Leef", "123", "Feel"],
+                "Flag": [True, False, True, False, True],
+            }
+        )
+        dataframe.to_csv(tmp_file, index=False)
+        expected, _ = Feel.filtering(filters, pd.read_csv(tmp_file), dataframe.columns)
+        monkeypatch.setattr(feel, "ARROW_NARROW_FRACTION", narrow_fraction)
+        filtered, _, _ = Feel.filter_streaming(tmp_file, filters, chunksize=2)
+        pd.testing.assert_frame_equal(filtered, expected, check_index_type=False)
+
+    def test_filter_streaming_int_nulls(self, tmp_path):
+        """test int columns with missing values keep their dtype whichever rows survive"""
+        tmp_file = tmp_path / "test_reader.csv"
+        tmp_file.write_text("A,B\n1,x\n,x\n3,y\n4,x\n", encoding="utf-8")
+        filtered, _, _ = Feel.filter_streaming(tmp_file, ["B:y"])
+        assert filtered["A"].dtype == np.float64
+        assert filtered["A"].tolist() == [3.0]
+
+    @pytest.mark.parametrize("chunksize, sample", [(1, 2), (3, 2), (10, 2), (2, 10)])
+    def test_filter_streaming_sample(self, tmp_path, chunksize, sample):
+        """test CSV file filtering keeps a random sample of the filtered rows"""
+        tmp_file = tmp_path / "test_reader.csv"
+        pd.DataFrame.from_dict({"ID": range(10), "Name": ["Feel", "Leef"] * 5}).to_csv(
+            tmp_file, index=False
+        )
+        filtered, _, _ = Feel.filter_streaming(
+            tmp_file, ["Name:Feel"], chunksize=chunksize, sample=sample
+        )
+        assert len(filtered) == min(sample, 5)
+        assert filtered["ID"].is_unique
+        assert set(filtered["ID"]) <= {0, 2, 4, 6, 8}
+
+    def test_filtering_query(self, monkeypatch):
+        """test numeric filters fused into a single DataFrame.query match the mask path"""
+        pytest.importorskip("numexpr")
+        dataframe = pd.DataFrame.from_dict(
+            {
+                "ID": [123, 124, 125, 126],
+                "Score Value": [1.5, np.nan, 3.5, 4.5],
+                "Name": ["Feel", "Feel", "Leef", "Feel"],
+            }
+        )
+        filters = ["ID:>123", "Score Value:~4.5", "ID:124|125|126", "Name:Feel"]
+        expected, _ = Feel.filtering(filters, dataframe, list(dataframe.columns))
+        monkeypatch.setattr(feel, "NUMEXPR_MIN_ELEMENTS", 0)
+        filtered, _ = Feel.filtering(filters, dataframe, list(dataframe.columns))
+        assert filtered.equals(expected)
+        assert filtered["ID"].tolist() == [124]
+        dataframe.columns = ["Order #", "Score\\Value", "Name"]
+        filters = ["Order #:>123", "Score\\Value:~4.5", "Order #:<126"]
+        filtered, _ = Feel.filtering(filters, dataframe, dataframe.columns)
+        assert filtered["Order #"].tolist() == [124, 125]
+
+    def test_filtering_literal_operators(self):
+        """test operator characters after the first one are matched literally"""
+        dataframe = pd.DataFrame.from_dict({"Name": ["a>b", "b", "a~b"]})
+        filtered, _ = Feel.filtering(["Name:a>b"], dataframe, ["Name"])
+        assert filtered["Name"].tolist() == ["a>b"]
+        filtered, _ = Feel.filtering(["Name:~a~b"], dataframe, ["Name"])
+        assert filtered["Name"].tolist() == ["a>b", "b"]
+
+    @pytest.mark.parametrize(
+        "filters, expected",
+        [
+            (["Value:1e2"], [100.0]),
+            (["Value:<inf"], [0.5, 100.0]),
+            (["Value:<99999999999999999999"], [0.5, 100.0]),
+            (["Value:<inf", "Value:<inf"], [0.5, 100.0]),
+            (["Value:>-.5", "Value:~100"], [0.5, np.inf]),
+            (["Name:1_0"], ["1_0"]),
+            (["Name:1_0|2_0"], ["1_0"]),
+            (["Value:1e2|nan|inf"], [100.0, np.inf]),
+            (["Value:100|99999999999999999999"], [100.0]),
+            (["Name:+7"], []),
+        ],
+    )
+    def test_filtering_numbers(self, filters, expected):
+        """test scalar filter values are classified as int, float or string"""
+        dataframe = pd.DataFrame.from_dict(
+            {"Value": [0.5, 100.0, np.inf], "Name": ["1_0", "7.0", "x"]}
+        )
+        filtered, in_use = Feel.filtering(filters, dataframe, ["Value", "Name"])
+        assert filtered[in_use[0]].tolist() == expected
+
+    @pytest.mark.parametrize("chunksize", [1, 2, 10])
+    def test_filter_to_csv(self, tmp_path, chunksize):
+        """test CSV file filtering written out chunk by chunk"""
+        tmp_file, out_file = tmp_path / "test_reader.csv", tmp_path / "filtered.csv"
+        data = {"ID": [123, 124, 125, 126], "Name": ["Feel", "Leef", "Feel", "Feel"]}
+
+        with open(tmp_file, "w", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(data.keys())
+            writer.writerows(zip(*data.values()))
+        Feel.filter_to_csv(tmp_file, out_file, ["Name:Feel"], chunksize=chunksize)
+        assert pd.read_csv(out_file)["ID"].tolist() == [123, 125, 126]
+        Feel.filter_to_csv(
+            tmp_file, out_file, ["ID:1"], chunksize=chunksize, columns=["Name"]
+        )
+        assert pd.read_csv(out_file).columns.tolist() == ["Name"]
+        assert pd.read_csv(out_file).empty
+
+    @pytest.mark.parametrize("chunksize", [1000, 100000])
+    def test_filter_to_csv_in_place(self, tmp_path, chunksize):
+        """test CSV file filtering can write over its own input, larger than read buffers"""
+        tmp_file = tmp_path / "test_reader.csv"
+        dataframe = pd.DataFrame({"ID": range(200000), "Name": "Feel"})
+        dataframe.loc[::3, "Name"] = "Leef"
+        dataframe.to_csv(tmp_file, index=False)
+        Feel.filter_to_csv(tmp_file, tmp_file, ["Name:Feel"], chunksize=chunksize)
+        expected = dataframe[dataframe["Name"] == "Feel"]["ID"].tolist()
+        assert pd.read_csv(tmp_file)["ID"].tolist() == expected
+        assert [path.name for path in tmp_path.iterdir()] == ["test_reader.csv"]
+
+    @pytest.mark.parametrize("chunksize", [2, 10])
+    @pytest.mark.parametrize(
+        "text, filters",
+        [
+            ("A,B\n18446744073709551615,x\n2,y\n", ["B:x"]),
+            ("A,B\n100000000000000000000,x\n2,y\n", ["A:2"]),
+            ("A,A\n1,2\n3,4\n", ["A:1"]),
+            ("A,A\n1,2\n3,4\n", ["A.1:2"]),
+            ("A,B\n1,x\n,x\n3,y\n4,x\n", ["B:x"]),
+            ("A,B\n1,x\n,x\n3,y\n4,x\n", ["B:y"]),
+            ("A,B\n1,x\n2,x\n3,y\n,x\n", ["B:x"]),
+            ('A,B,C\n1,"x,y",NA\n2,x,\n,x,1.5\n', ["B:x"]),
+        ],
+    )
+    def test_filter_to_csv_like_pandas(self, tmp_path, text, filters, chunksize):
+        """test CSV file filtering chunk by chunk writes what filtering the whole file does"""
+        tmp_file, out_file = tmp_path / "test_reader.csv", tmp_path / "filtered.csv"
+        tmp_file.write_text(text, encoding="utf-8")
+        dataframe = pd.read_csv(tmp_file)
+        expected, _ = Feel.filtering(filters, dataframe, dataframe.columns)
+        Feel.filter_to_csv(tmp_file, out_file, filters, chunksize=chunksize)
+        assert out_file.read_text(encoding="utf-8") == expected.to_csv(index=False)